@@ -3,126 +3,461 @@
 CLI wrapper for the brand assets MCP to be called from Node.js
 """
 import json
+import logging
+import os
 import sys
-import requests
+import tempfile
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 
+# Faster JSON decoding/encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # Copy the core functionality without FastMCP dependency
 METADATA_URL = 'https://raw.githubusercontent.com/b-ciq/brand-assets-ecosystem/main/core-mcp-dev/metadata/asset-inventory.json'
-import os
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOCAL_METADATA_PATH = os.path.join(SCRIPT_DIR, 'metadata', 'asset-inventory.json')
 SEARCH_PATTERNS_PATH = os.path.join(SCRIPT_DIR, 'metadata', 'search-patterns.json')
 
+# On-disk copy of the GitHub metadata, revalidated with ETag/Last-Modified; kept in a
+# per-user cache dir since a shared temp dir lets other users plant or redirect it
+REMOTE_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'brand-assets')
+REMOTE_CACHE_PATH = os.path.join(REMOTE_CACHE_DIR, 'inventory.json')
+REMOTE_CACHE_META_PATH = os.path.join(REMOTE_CACHE_DIR, 'inventory.meta.json')
+REMOTE_CACHE_MAX_AGE = 300  # seconds before the cached copy is revalidated
+
+# GitHub fetches go through stdlib urllib (cheap to import on a cold CLI start),
+# retrying transient failures with exponential backoff. Callers kill the CLI after
+# 10s, so every attempt and backoff has to fit inside FETCH_DEADLINE.
+FETCH_TIMEOUT = 3  # seconds per connect/read
+FETCH_DEADLINE = 8  # seconds for all attempts together
+FETCH_RETRIES = 3
+FETCH_BACKOFF = 0.3  # seconds, doubled on each retry
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+def http_get(url: str, headers: Dict[str, str]) -> tuple:
+    """GET a URL, returning (status, body, headers); a 304 is returned rather than raised"""
+    import gzip
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+    
+    request = Request(url, headers={"Accept-Encoding": "gzip", "User-Agent": "brand-assets-mcp/1", **headers})
+    deadline = time.monotonic() + FETCH_DEADLINE
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            timeout = min(FETCH_TIMEOUT, deadline - time.monotonic())
+            with urlopen(request, timeout=timeout) as response:
+                body = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return response.status, body, response.headers
+        except HTTPError as e:
+            if e.code == 304:
+                return e.code, b'', e.headers
+            if e.code not in RETRY_STATUSES:
+                raise
+            error = e
+        except OSError as e:
+            error = e
+        
+        # Give up once the retries or the time left for another attempt run out
+        delay = FETCH_BACKOFF * 2 ** attempt
+        if attempt == FETCH_RETRIES or time.monotonic() + delay + 1 >= deadline:
+            raise error
+        time.sleep(delay)
+
+# Circuit breaker: after repeated failed fetches, skip GitHub until the reset window passes.
+# Each query runs in a fresh CLI process, so the state is kept next to the metadata cache.
+BREAKER_FAIL_MAX = 3
+BREAKER_RESET_TIMEOUT = 30  # seconds
+BREAKER_STATE_PATH = os.path.join(REMOTE_CACHE_DIR, 'breaker.json')
+
+def load_breaker_state() -> Dict[str, float]:
+    """Read the persisted breaker state, treating a missing or unreadable file as closed"""
+    try:
+        state = read_json_file(BREAKER_STATE_PATH)
+        return {'failures': int(state['failures']), 'opened_at': float(state['opened_at'])}
+    except Exception:
+        return {'failures': 0, 'opened_at': 0.0}
+
+def remote_fetch_allowed() -> bool:
+    """Whether the breaker lets a remote fetch through (half-open once the reset window passes)"""
+    state = load_breaker_state()
+    if state['failures'] < BREAKER_FAIL_MAX:
+        return True
+    return time.time() - state['opened_at'] >= BREAKER_RESET_TIMEOUT
+
+def record_remote_result(ok: bool):
+    """Close the breaker on success; count failures and (re)open it at the threshold"""
+    try:
+        if ok:
+            if os.path.exists(BREAKER_STATE_PATH):
+                os.remove(BREAKER_STATE_PATH)
+            return
+        
+        state = load_breaker_state()
+        state['failures'] += 1
+        if state['failures'] >= BREAKER_FAIL_MAX:
+            state['opened_at'] = time.time()
+        _write_atomic(BREAKER_STATE_PATH, json.dumps(state).encode())
+    except OSError as e:
+        logger.warning("Could not update fetch breaker state: %s", e)
+
+# Parsed asset data memoized for long-lived callers that load it repeatedly: a local
+# inventory is reused while its (mtime, size) is unchanged, GitHub data for ASSET_DATA_TTL
+ASSET_DATA_TTL = 300  # seconds
+_asset_data_cache = {'loaded_at': 0.0, 'source': None, 'local_stamp': None, 'data': None}
+
+def local_metadata_stamp() -> Optional[tuple]:
+    """(mtime_ns, size) of the local inventory, or None when there isn't one"""
+    try:
+        stat = os.stat(LOCAL_METADATA_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 def load_asset_data():
-    """Load asset metadata from local file first, fallback to GitHub"""
-    import os
+    """Load asset metadata, reusing the parsed copy while its source is unchanged"""
+    local_stamp = local_metadata_stamp()
+    cache = _asset_data_cache
+    if cache['data'] is not None and cache['local_stamp'] == local_stamp and (
+        cache['source'] == 'local' or time.monotonic() - cache['loaded_at'] < ASSET_DATA_TTL
+    ):
+        return cache['data']
     
+    data, source = _load_asset_data_uncached(local_stamp is not None)
+    if data is not None:
+        prepare_asset_data(data)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Loaded %d assets across %d products",
+                        sum(len(assets) for assets in data['assets'].values()), len(data['assets']))
+        cache.update(loaded_at=time.monotonic(), source=source, local_stamp=local_stamp, data=data)
+    return data
+
+def _load_asset_data_uncached(local_exists: bool):
+    """Load asset metadata from local file first, fallback to GitHub; returns (data, source)"""
     # Try local file first for development
-    if os.path.exists(LOCAL_METADATA_PATH):
+    if local_exists:
         try:
-            with open(LOCAL_METADATA_PATH, 'r') as f:
-                return json.load(f)
+            data = read_json_file(LOCAL_METADATA_PATH)
+            validate_asset_data(data)
+            return data, 'local'
         except Exception as e:
-            print(f"Error loading local metadata: {e}", file=sys.stderr)
+            logger.error("Error loading local metadata: %s", e)
     
     # Fallback to GitHub
+    return fetch_remote_metadata(), 'remote'
+
+def validate_asset_data(data: Any):
+    """Fail fast on inventories whose assets aren't {product: {asset_key: {...}}}"""
+    if not isinstance(data, dict) or not isinstance(data.get('assets'), dict):
+        raise ValueError("asset inventory must be an object with an 'assets' object")
+    for product, assets in data['assets'].items():
+        if not isinstance(assets, dict):
+            raise ValueError(f"assets.{product} must be an object")
+        for asset_key, asset_info in assets.items():
+            if not isinstance(asset_info, dict):
+                raise ValueError(f"assets.{product}.{asset_key} must be an object")
+
+def loads_json(data: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize a response to compact JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def write_json(data: Any):
+    """Write a response as one JSON line straight to the stdout byte stream"""
+    sys.stdout.buffer.write(dumps_json(data) + b'\n')
+
+def read_json_file(path: str):
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+def _write_atomic(path: str, data: bytes):
+    """Write a file via a private temp file + rename so readers never see a partial file"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
     try:
-        response = requests.get(METADATA_URL, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def read_stale_cache():
+    """Serve the on-disk metadata cache regardless of age when GitHub can't be reached (stale-if-error)"""
+    if not os.path.exists(REMOTE_CACHE_PATH):
+        return None
+    try:
+        data = read_json_file(REMOTE_CACHE_PATH)
+        validate_asset_data(data)
     except Exception as e:
+        logger.warning("Ignoring metadata cache: %s", e)
         return None
+    logger.warning("Serving cached GitHub metadata")
+    return data
+
+def fetch_remote_metadata():
+    """Fetch asset metadata from GitHub, using a conditional GET against the on-disk cache"""
+    headers = {}
+    if os.path.exists(REMOTE_CACHE_PATH):
+        try:
+            # Fresh cache - skip the network entirely
+            if time.time() - os.path.getmtime(REMOTE_CACHE_PATH) < REMOTE_CACHE_MAX_AGE:
+                data = read_json_file(REMOTE_CACHE_PATH)
+                validate_asset_data(data)
+                return data
+
+            cache_meta = read_json_file(REMOTE_CACHE_META_PATH)
+            if cache_meta.get('etag'):
+                headers['If-None-Match'] = cache_meta['etag']
+            if cache_meta.get('last_modified'):
+                headers['If-Modified-Since'] = cache_meta['last_modified']
+        except Exception as e:
+            logger.warning("Ignoring metadata cache: %s", e)
+            headers = {}
+
+    if not remote_fetch_allowed():
+        logger.warning("Skipping GitHub metadata fetch after repeated failures")
+        return read_stale_cache()
+
+    try:
+        status, body, response_headers = http_get(METADATA_URL, headers)
+        if status == 304:
+            # Unchanged upstream - restart the freshness window and reuse the cached body
+            os.utime(REMOTE_CACHE_PATH)
+            record_remote_result(True)
+            data = read_json_file(REMOTE_CACHE_PATH)
+            validate_asset_data(data)
+            return data
+
+        data = loads_json(body)
+        validate_asset_data(data)
+    except Exception as e:
+        logger.warning("Could not fetch GitHub metadata: %s", e)
+        record_remote_result(False)
+        return read_stale_cache()
+    record_remote_result(True)
+
+    try:
+        _write_atomic(REMOTE_CACHE_PATH, body)
+        _write_atomic(REMOTE_CACHE_META_PATH, json.dumps({
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified')
+        }).encode())
+    except OSError as e:
+        logger.warning("Could not write metadata cache: %s", e)
+
+    return data
+
+# Prepared search patterns, rebuilt only when the patterns file changes
+_search_patterns_cache = {'mtime_ns': None, 'patterns': None}
 
 def load_search_patterns():
-    """Load search patterns for product name resolution"""
+    """Load search patterns for product name resolution (prepared once per file version)"""
     try:
-        with open(SEARCH_PATTERNS_PATH, 'r') as f:
-            return json.load(f)
+        mtime_ns = os.stat(SEARCH_PATTERNS_PATH).st_mtime_ns
+        if _search_patterns_cache['patterns'] is not None and _search_patterns_cache['mtime_ns'] == mtime_ns:
+            return _search_patterns_cache['patterns']
+        patterns = read_json_file(SEARCH_PATTERNS_PATH)
     except Exception as e:
-        print(f"Warning: Could not load search patterns: {e}", file=sys.stderr)
+        logger.warning("Could not load search patterns: %s", e)
         return None
+    
+    if isinstance(patterns, dict) and isinstance(patterns.get('product_patterns'), dict):
+        patterns['_alias_map'] = build_alias_map(patterns['product_patterns'])
+    if isinstance(patterns, dict):
+        patterns['_ciq_general_keywords'] = build_ciq_general_keywords(patterns)
+    _search_patterns_cache.update(mtime_ns=mtime_ns, patterns=patterns)
+    return patterns
+
+def build_ciq_general_keywords(patterns: Dict) -> frozenset:
+    """Lowercase general-search keywords that pull in the CIQ company logos (always including the empty query)"""
+    ciq_rules = patterns.get('search_rules', {}).get('ciq_inclusion', {}).get('rules', {})
+    general_keywords = ciq_rules.get('general_search_keywords', ['logo', 'brand', 'company', 'all', ''])
+    return frozenset(kw.lower() for kw in general_keywords) | {''}
+
+def build_alias_map(product_patterns: Dict[str, List[str]]) -> Dict[str, str]:
+    """Flatten product names and lowercase aliases into one lookup; names and earlier products win"""
+    alias_map = {product: product for product in product_patterns}
+    for product, aliases in product_patterns.items():
+        for alias in aliases:
+            alias_map.setdefault(alias.lower(), product)
+    return alias_map
 
 def resolve_product_from_query(query: str, patterns: Dict) -> Optional[str]:
     """Resolve a query to actual product name using patterns"""
+    return resolve_normalized_query(query.lower().strip(), patterns)
+
+def resolve_normalized_query(query_lower: str, patterns: Dict) -> Optional[str]:
+    """Match an already lowercased/stripped query against product names and their aliases"""
     if not patterns or 'product_patterns' not in patterns:
         return None
     
-    query_lower = query.lower().strip()
-    
-    # Direct product name match
-    if query_lower in patterns['product_patterns']:
-        return query_lower
-    
-    # Pattern matching
-    for product, aliases in patterns['product_patterns'].items():
-        if query_lower in [alias.lower() for alias in aliases]:
-            return product
-    
-    return None
+    alias_map = patterns.get('_alias_map')
+    if alias_map is None:
+        alias_map = build_alias_map(patterns['product_patterns'])
+    return alias_map.get(query_lower)
+
+def get_search_blob(product: str, asset_key: str, asset_info: Dict) -> str:
+    """Lowercased, newline-joined searchable fields, so one substring test covers them all"""
+    fields = [
+        product,
+        asset_key,
+        asset_info.get('filename', ''),
+        *asset_info.get('tags', []),
+        *asset_info.get('searchable_content', []),
+        asset_info.get('content_summary', ''),
+        asset_info.get('document_type', '').replace('-', ' ')
+    ]
+    return '\n'.join(field.lower() for field in fields if field)
+
+def prepare_asset_data(asset_data: Dict):
+    """Precompute per-load lookup structures so searches skip per-asset string work"""
+    # Search blobs live in a side table so result assets can be returned without copying
+    search_blobs = {}
+    for product, assets in asset_data['assets'].items():
+        product_blobs = search_blobs[product] = {}
+        for asset_key, asset_info in assets.items():
+            # Always rebuilt: a blob stored in the file goes stale when entries are edited by hand
+            asset_info.pop('_search_blob', None)
+            product_blobs[asset_key] = get_search_blob(product, asset_key, asset_info)
+    asset_data['_search_blobs'] = search_blobs
+    index_assets_by_type(asset_data)
+
+def asset_type_of(asset_info: Dict) -> str:
+    """Classify an asset as 'document' or 'logo' for asset type filtering"""
+    return 'document' if asset_info.get('type') == 'document' else 'logo'
+
+def index_assets_by_type(asset_data: Dict):
+    """Bucket each product's assets by asset type once per load"""
+    by_type = {}
+    for product, assets in asset_data['assets'].items():
+        buckets = {'logo': {}, 'document': {}}
+        for asset_key, asset_info in assets.items():
+            buckets[asset_type_of(asset_info)][asset_key] = asset_info
+        by_type[product] = buckets
+    asset_data['_assets_by_type'] = by_type
+
+def get_product_assets_of_type(asset_data: Dict, product: str, asset_type: str) -> Dict[str, Dict]:
+    """Return a product's assets of one type, from the load-time buckets when present"""
+    by_type = asset_data.get('_assets_by_type')
+    if by_type is not None and product in by_type:
+        return by_type[product].get(asset_type, {})
+    return {k: v for k, v in asset_data['assets'][product].items() if asset_type_of(v) == asset_type}
+
+def ciq_logo_entry(background: str, color: str, tags: List[str]) -> Dict[str, Any]:
+    """Build a CIQ company logo asset (1-color horizontal lockup for a light or dark background)"""
+    filename = f"CIQ_logo_1clr_{background}mode.svg"
+    return {
+        "url": f"/assets/global/CIQ_logos/{filename}",
+        "filename": filename,
+        "background": background,
+        "color": color,
+        "layout": "horizontal",
+        "colorVariant": "1-color",
+        "type": "logo",
+        "size": "large",
+        "tags": tags
+    }
+
+def ciq_logos() -> Dict[str, Dict[str, Any]]:
+    """CIQ company logos, which aren't in the asset data; built fresh for each result"""
+    return {
+        "1color_light": ciq_logo_entry('light', 'black', ["company", "primary", "general-use"]),
+        "1color_dark": ciq_logo_entry('dark', 'white', ["company", "dark-mode"])
+    }
+
+# Search results keyed by (normalized query, options), reset whenever different data or patterns are passed in
+SEARCH_CACHE_SIZE = 256
+_search_cache = {'asset_data': None, 'patterns': None, 'entries': OrderedDict()}
+
+def search_recommendation(query: str, total_found: int, show_all_variants: bool) -> str:
+    """Human-readable summary line for a search result"""
+    return f"Found {total_found} assets matching '{query}'" + (" (primary variants)" if not show_all_variants else " (all variants)")
 
 def enhanced_search(query: str, asset_data: Dict, patterns: Dict, show_all_variants: bool = False, asset_type_filter: Optional[str] = None) -> Dict[str, Any]:
-    """Enhanced search with pattern matching and unified logic"""
+    """Enhanced search with pattern matching and unified logic (LRU-cached per normalized query)"""
     if not asset_data or 'assets' not in asset_data:
         return {"error": "No asset data available"}
     
+    if _search_cache['asset_data'] is not asset_data or _search_cache['patterns'] is not patterns:
+        _search_cache.update(asset_data=asset_data, patterns=patterns, entries=OrderedDict())
+    entries = _search_cache['entries']
+    key = (query.lower().strip(), show_all_variants, asset_type_filter)
+    cached = entries.get(key)
+    if cached is not None:
+        entries.move_to_end(key)
+        # Only the recommendation echoes the query as typed
+        return {**cached, 'recommendation': search_recommendation(query, cached['total_found'], show_all_variants)}
+    
+    result = _enhanced_search_uncached(query, asset_data, patterns, show_all_variants, asset_type_filter)
+    entries[key] = result
+    if len(entries) > SEARCH_CACHE_SIZE:
+        entries.popitem(last=False)
+    # Callers annotate the top level (e.g. main's _source), so never hand out the cached dict itself
+    return {**result}
+
+def _enhanced_search_uncached(query: str, asset_data: Dict, patterns: Dict, show_all_variants: bool, asset_type_filter: Optional[str]) -> Dict[str, Any]:
+    """Resolve the query to a product or keyword-match it across the inventory"""
     query_lower = query.lower().strip()
     results = {}
     total_found = 0
     
     # STEP 1: Try to resolve query to specific product using patterns
-    resolved_product = resolve_product_from_query(query, patterns) if patterns else None
+    resolved_product = resolve_normalized_query(query_lower, patterns) if patterns else None
     
     if resolved_product:
         # Specific product search - return only that product
-        print(f"🎯 Resolved '{query}' → '{resolved_product}'", file=sys.stderr)
+        logger.debug("🎯 Resolved '%s' → '%s'", query, resolved_product)
         if resolved_product == 'ciq':
             # Special handling for CIQ - it's not in asset data but we have the logos
-            print(f"🎯 Including CIQ company logos for specific CIQ search", file=sys.stderr)
+            logger.debug("🎯 Including CIQ company logos for specific CIQ search")
             # CIQ logos will be added below in the CIQ inclusion logic
         elif resolved_product in asset_data['assets']:
             if asset_type_filter:
                 # Apply asset type filtering to specific product results
-                filtered_assets = {}
-                for asset_key, asset_info in asset_data['assets'][resolved_product].items():
-                    asset_asset_type = 'document' if asset_info.get('type') == 'document' else 'logo'
-                    if asset_asset_type == asset_type_filter:
-                        filtered_assets[asset_key] = asset_info
+                filtered_assets = get_product_assets_of_type(asset_data, resolved_product, asset_type_filter)
                 results[resolved_product] = filtered_assets
                 total_found = len(filtered_assets)
             else:
                 results[resolved_product] = asset_data['assets'][resolved_product]
                 total_found = len(asset_data['assets'][resolved_product])
         else:
-            print(f"⚠️  Product '{resolved_product}' not found in asset data", file=sys.stderr)
+            logger.debug("⚠️  Product '%s' not found in asset data", resolved_product)
     else:
         # General search - fallback to keyword matching
-        print(f"🔍 General search for '{query}'", file=sys.stderr)
+        logger.debug("🔍 General search for '%s'", query)
+        search_blobs = asset_data['_search_blobs']
         for product, assets in asset_data['assets'].items():
             product_matches = {}
+            product_blobs = search_blobs[product]
+            # A query that hits the product name matches every asset of the product
+            product_hit = query_lower in product.lower()
+            
+            # Apply asset type filtering up front: only scan the requested type's bucket
+            if asset_type_filter:
+                assets = get_product_assets_of_type(asset_data, product, asset_type_filter)
             
             for asset_key, asset_info in assets.items():
-                # Check if query matches product name, asset key, filename, tags, or searchable content
-                matches = (
-                    query_lower in product.lower() or
-                    query_lower in asset_key.lower() or
-                    query_lower in asset_info.get('filename', '').lower() or
-                    any(query_lower in tag.lower() for tag in asset_info.get('tags', [])) or
-                    # For PDFs, also search in searchable content
-                    any(query_lower in content.lower() for content in asset_info.get('searchable_content', [])) or
-                    # Search in content summary for PDFs
-                    query_lower in asset_info.get('content_summary', '').lower() or
-                    # Search in document type
-                    query_lower in asset_info.get('document_type', '').replace('-', ' ').lower()
-                )
-                
-                if matches:
-                    # Apply asset type filtering if specified
-                    if asset_type_filter:
-                        asset_asset_type = 'document' if asset_info.get('type') == 'document' else 'logo'
-                        if asset_asset_type != asset_type_filter:
-                            continue  # Skip this asset
-
+                # Blobs are the precomputed newline-joined lowercase copy of the searchable fields
+                if product_hit or query_lower in product_blobs[asset_key]:
                     product_matches[asset_key] = asset_info
                     total_found += 1
             
@@ -132,44 +467,21 @@ def enhanced_search(query: str, asset_data: Dict, patterns: Dict, show_all_varia
     # Check if CIQ company logos should be included
     should_include_ciq = False
     if not resolved_product:  # General search
-        ciq_rules = patterns.get('search_rules', {}).get('ciq_inclusion', {}).get('rules', {})
-        general_keywords = ciq_rules.get('general_search_keywords', ['logo', 'brand', 'company', 'all', ''])
+        general_keywords = patterns.get('_ciq_general_keywords')
+        if general_keywords is None:
+            general_keywords = build_ciq_general_keywords(patterns)
         
-        if query_lower in [kw.lower() for kw in general_keywords] or query_lower == '':
+        if query_lower in general_keywords:
             should_include_ciq = True
-            print(f"🎯 Including CIQ company logos for general search: '{query}'", file=sys.stderr)
+            logger.debug("🎯 Including CIQ company logos for general search: '%s'", query)
     elif resolved_product == 'ciq':  # Specific CIQ search
         should_include_ciq = True
-        print(f"🎯 Including CIQ company logos for specific CIQ search", file=sys.stderr)
+        logger.debug("🎯 Including CIQ company logos for specific CIQ search")
     
     # Add CIQ company logos if criteria met
     if should_include_ciq:
-        ciq_logos = {
-            "1color_light": {
-                "url": "/assets/global/CIQ_logos/CIQ_logo_1clr_lightmode.svg",
-                "filename": "CIQ_logo_1clr_lightmode.svg",
-                "background": "light",
-                "color": "black",
-                "layout": "horizontal",
-                "colorVariant": "1-color",
-                "type": "logo",
-                "size": "large",
-                "tags": ["company", "primary", "general-use"]
-            },
-            "1color_dark": {
-                "url": "/assets/global/CIQ_logos/CIQ_logo_1clr_darkmode.svg",
-                "filename": "CIQ_logo_1clr_darkmode.svg",
-                "background": "dark",
-                "color": "white",
-                "layout": "horizontal",
-                "colorVariant": "1-color",
-                "type": "logo",
-                "size": "large",
-                "tags": ["company", "dark-mode"]
-            }
-        }
-        results['ciq'] = ciq_logos
-        total_found += len(ciq_logos)
+        results['ciq'] = ciq_logos()
+        total_found += len(results['ciq'])
     
     # Filter to primary variants only unless show_all_variants is True
     if not show_all_variants and results:
@@ -177,27 +489,26 @@ def enhanced_search(query: str, asset_data: Dict, patterns: Dict, show_all_varia
         filtered_total = 0
 
         for product, product_assets in results.items():
+            # Always include documents (they are not variants of each other);
+            # for logos, track the primary variant (first horizontal, else first logo) in the same pass
             filtered_assets = {}
-
-            # Always include documents (they are not variants of each other)
-            documents = {k: v for k, v in product_assets.items() if v.get('type') == 'document'}
-            filtered_assets.update(documents)
-
-            # For logos, find primary variant (horizontal layout preferred)
-            logos = {k: v for k, v in product_assets.items() if v.get('type') != 'document'}
-            if logos:
-                primary_logo_key = None
-                for asset_key, asset_info in logos.items():
+            first_logo_key = None
+            primary_logo_key = None
+            for asset_key, asset_info in product_assets.items():
+                if asset_info.get('type') == 'document':
+                    filtered_assets[asset_key] = asset_info
+                elif primary_logo_key is None:
+                    if first_logo_key is None:
+                        first_logo_key = asset_key
                     if asset_info.get('layout') == 'horizontal':
                         primary_logo_key = asset_key
-                        break
 
-                # Fallback to first logo if no horizontal found
-                if not primary_logo_key:
-                    primary_logo_key = list(logos.keys())[0]
+            # Fallback to first logo if no horizontal found
+            if primary_logo_key is None:
+                primary_logo_key = first_logo_key
 
-                if primary_logo_key:
-                    filtered_assets[primary_logo_key] = logos[primary_logo_key]
+            if primary_logo_key is not None:
+                filtered_assets[primary_logo_key] = product_assets[primary_logo_key]
 
             if filtered_assets:
                 filtered_results[product] = filtered_assets
@@ -211,14 +522,28 @@ def enhanced_search(query: str, asset_data: Dict, patterns: Dict, show_all_varia
         'total_found': total_found,
         'assets': results,
         'confidence': 'medium' if total_found > 0 else 'none',
-        'recommendation': f"Found {total_found} assets matching '{query}'" + (" (primary variants)" if not show_all_variants else " (all variants)")
+        'recommendation': search_recommendation(query, total_found, show_all_variants)
     }
 
+def search_batch(queries: List[str], asset_data: Dict, patterns: Dict, show_all_variants: bool = False, asset_type_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Run enhanced_search for several queries, computing each distinct query once"""
+    results = {}
+    for query in queries:
+        if query not in results:
+            results[query] = enhanced_search(query, asset_data, patterns, show_all_variants, asset_type_filter)
+    return [results[query] for query in queries]
+
 def main():
+    # Search diagnostics are DEBUG logs; BRAND_ASSETS_DEBUG=1 turns them on
+    debug = os.environ.get('BRAND_ASSETS_DEBUG', '') not in ('', '0')
+    logging.basicConfig(level=logging.DEBUG if debug else logging.WARNING, format='%(message)s', stream=sys.stderr)
+    
     # Parse command line arguments
     import argparse
     parser = argparse.ArgumentParser(description='Brand Assets Search CLI')
-    parser.add_argument('query', help='Search query')
+    parser.add_argument('query', nargs='+', help='Search query (several with --batch)')
+    parser.add_argument('--batch', action='store_true',
+                       help='Search every query and print a JSON array of results')
     parser.add_argument('--show-all-variants', action='store_true',
                        help='Show all asset variants instead of just primary variants')
     parser.add_argument('--asset-type', choices=['logo', 'document', 'all'], default='all',
@@ -226,35 +551,40 @@ def main():
 
     try:
         args = parser.parse_args()
-        query = args.query
+        if len(args.query) > 1 and not args.batch:
+            parser.error('multiple queries require --batch')
+        queries = args.query
+        batch = args.batch
         show_all_variants = args.show_all_variants
         asset_type_filter = args.asset_type if args.asset_type != 'all' else None
     except SystemExit:
         # Fallback to old behavior for backward compatibility
         if len(sys.argv) == 2:
-            query = sys.argv[1]
+            queries = [sys.argv[1]]
+            batch = False
             show_all_variants = False
             asset_type_filter = None
         else:
-            print(json.dumps({"error": "Usage: python cli_wrapper.py '<query>' [--show-all-variants] [--asset-type {logo,document,all}]"}))
+            write_json({"error": "Usage: python cli_wrapper.py '<query>' [--show-all-variants] [--asset-type {logo,document,all}] [--batch '<query>' ...]"})
             sys.exit(1)
     
     # V2 API proxy disabled for performance - go straight to fast local search
     
     # Use unified search with patterns
-    print(f"🔄 CLI: Using unified search for '{query}'", file=sys.stderr)
+    logger.debug("🔄 CLI: Using unified search for %s", queries)
     asset_data = load_asset_data()
     if not asset_data:
-        print(json.dumps({"error": "Failed to load asset data"}))
+        write_json({"error": "Failed to load asset data"})
         sys.exit(1)
     
     # Load search patterns for enhanced matching
     search_patterns = load_search_patterns()
     
     # Search using enhanced logic with patterns
-    result = enhanced_search(query, asset_data, search_patterns, show_all_variants, asset_type_filter)
-    result['_source'] = 'cli_unified_search'
-    print(json.dumps(result))
+    results = search_batch(queries, asset_data, search_patterns, show_all_variants, asset_type_filter)
+    for result in results:
+        result['_source'] = 'cli_unified_search'
+    write_json(results if batch else results[0])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -21,6 +21,13 @@ except ImportError as e:
     print(f"Warning: PDF processing libraries not available: {e}")
     PDF_LIBS_AVAILABLE = False
 
+# Common business/technical terms that might be relevant
+BUSINESS_TERMS = (
+    'solution', 'enterprise', 'cloud', 'security', 'performance',
+    'scalability', 'management', 'automation', 'integration', 'platform',
+    'container', 'kubernetes', 'docker', 'linux', 'open source'
+)
+
 def detect_document_type(pdf_path: str) -> str:
     """Detect if PDF is solution-brief or brand-guidelines based on file location"""
     path = Path(pdf_path)
@@ -230,16 +237,7 @@ def extract_searchable_keywords(text: str, document_type: str, product: Optional
     if text and len(text.strip()) > 10:
         text_lower = text.lower()
         
-        # Common business/technical terms that might be relevant
-        business_terms = [
-            'solution', 'enterprise', 'cloud', 'security', 'performance', 
-            'scalability', 'management', 'automation', 'integration', 'platform',
-            'container', 'kubernetes', 'docker', 'linux', 'open source'
-        ]
-        
-        for term in business_terms:
-            if term in text_lower:
-                keywords.append(term)
+        keywords.extend([t for t in BUSINESS_TERMS if t in text_lower])
         
         # Add first meaningful words from text (limit to avoid bloat)
         words = text.split()[:100]  # First 100 words
@@ -7,14 +7,72 @@ NO complex JSON responses, NO fake asset claims, NO multiple confusing tools.
 """
 
 from fastmcp import FastMCP
+from collections import OrderedDict
+import copy
 import json
 import os
 import subprocess
+import threading
+import time
+
+# Faster decoding of CLI output when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Initialize FastMCP server
 mcp = FastMCP("CIQ Brand Assets")
 
+# Product help appended to find_logo's not-found replies
+PRODUCT_HELP = "Available products: apptainer, fuzzball, warewulf, ascender, rlc-hardened, rlc-ai, ciq"
+
+# Product names and aliases from find_logo's docstring, prefetched at startup when CIQ_MCP_WARMUP=1
+WARMUP_QUERIES = (
+    'apptainer', 'fuzzball', 'warewulf', 'ascender', 'rlc-hardened', 'rlc-ai', 'ciq',
+    'app', 'fuzz', 'war', 'asc', 'roc', 'ai'
+)
+
+# Size presets described as "<size> size"; custom sizes like "1024px" are shown as-is
+SIZE_PRESETS = frozenset({'S', 'M', 'L'})
+
+# find_logo variant options: (argument name, web GUI URL parameter, description formatter)
+VARIANT_OPTIONS = (
+    ('variant', 'variant', lambda value: value),
+    ('color_mode', 'colorMode', lambda value: f"{value} mode"),
+    ('format', 'format', str.upper),
+    ('size', 'size', lambda value: f"{value} size" if value in SIZE_PRESETS else value),
+)
+
+# CLI results keyed by normalized query; entries expire so inventory updates show up
+CLI_CACHE_SIZE = 128
+CLI_CACHE_TTL = 300  # seconds
+_cli_cache = OrderedDict()
+_cli_cache_lock = threading.Lock()
+
 def call_unified_cli(query: str) -> dict:
+    """Call unified CLI backend, reusing recent results for the same normalized query"""
+    # The CLI itself only lowercases and strips the query, so this key never merges distinct searches
+    key = query.lower().strip()
+    with _cli_cache_lock:
+        entry = _cli_cache.get(key)
+        if entry and time.monotonic() - entry[0] < CLI_CACHE_TTL:
+            _cli_cache.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
+    result = _run_unified_cli(query)
+
+    # Cache real answers (including empty ones) but not transient failures
+    if "error" not in result:
+        with _cli_cache_lock:
+            _cli_cache[key] = (time.monotonic(), copy.deepcopy(result))
+            _cli_cache.move_to_end(key)
+            if len(_cli_cache) > CLI_CACHE_SIZE:
+                _cli_cache.popitem(last=False)
+    return result
+
+def _run_unified_cli(query: str) -> dict:
     """Call unified CLI backend - same approach as Web GUI"""
     try:
         cli_path = os.path.join(os.path.dirname(__file__), 'cli_wrapper.py')
@@ -25,13 +83,17 @@ def call_unified_cli(query: str) -> dict:
             return {"error": f"Search failed: {result.stderr}"}
         
         # Parse JSON output (last line)
-        lines = result.stdout.strip().split('\n')
-        json_output = lines[-1]
-        return json.loads(json_output)
+        json_output = result.stdout.strip().rpartition('\n')[2]
+        return orjson.loads(json_output) if ORJSON_AVAILABLE else json.loads(json_output)
     
     except Exception as e:
         return {"error": f"Failed to search: {e}"}
 
+def warm_cli_cache():
+    """Populate the CLI result cache so the first real requests skip the subprocess"""
+    for query in WARMUP_QUERIES:
+        call_unified_cli(query)
+
 @mcp.tool()
 def find_logo(product_name: str, variant: str = "", color_mode: str = "", format: str = "", size: str = "") -> str:
     """
@@ -54,13 +116,13 @@ def find_logo(product_name: str, variant: str = "", color_mode: str = "", format
     result = call_unified_cli(product_name)
 
     if "error" in result:
-        return f"Sorry, I couldn't find any logos for '{product_name}'. Available products: apptainer, fuzzball, warewulf, ascender, rlc-hardened, rlc-ai, ciq"
+        return f"Sorry, I couldn't find any logos for '{product_name}'. {PRODUCT_HELP}"
 
     if result.get("total_found", 0) == 0:
-        return f"No logos found for '{product_name}'. Available products: apptainer, fuzzball, warewulf, ascender, rlc-hardened, rlc-ai, ciq"
+        return f"No logos found for '{product_name}'. {PRODUCT_HELP}"
 
     # Extract resolved product name from results
-    first_product = list(result["assets"].keys())[0]
+    first_product = next(iter(result["assets"]))
 
     # Generate web GUI URL - use environment variable or default to production
     base_url = os.getenv('WEB_GUI_URL', 'https://lighthearted-fenglisu-f8b66c.netlify.app')
@@ -68,32 +130,17 @@ def find_logo(product_name: str, variant: str = "", color_mode: str = "", format
     # Build variant URL parameters
     url_params = [f"product={first_product.lower()}"]
 
-    if variant:
-        url_params.append(f"variant={variant}")
-    if color_mode:
-        url_params.append(f"colorMode={color_mode}")
-    if format:
-        url_params.append(f"format={format}")
-    if size:
-        url_params.append(f"size={size}")
+    arguments = {'variant': variant, 'color_mode': color_mode, 'format': format, 'size': size}
+    requested = [(param, arguments[name], describe) for name, param, describe in VARIANT_OPTIONS if arguments[name]]
 
     # Always add openModal=true if any specific variant is requested
-    if variant or color_mode or format or size:
+    if requested:
+        url_params.extend(f"{param}={value}" for param, value, _ in requested)
         url_params.append("openModal=true")
         web_url = f"{base_url}?{'&'.join(url_params)}"
 
         # Generate descriptive response for specific variant
-        variant_desc = []
-        if variant:
-            variant_desc.append(variant)
-        if color_mode:
-            variant_desc.append(f"{color_mode} mode")
-        if format:
-            variant_desc.append(format.upper())
-        if size:
-            variant_desc.append(f"{size} size" if size in ['S', 'M', 'L'] else size)
-
-        desc = " ".join(variant_desc) if variant_desc else "configured"
+        desc = " ".join(describe(value) for _, value, describe in requested)
         return f"Here's the {first_product.upper()} logo ({desc}): {web_url}"
 
     else:
@@ -111,4 +158,7 @@ if __name__ == "__main__":
     print("🚀 Starting CIQ Brand Assets MCP Server...")
     print("✅ Single tool: find_logo(product_name)")
     print("✅ Uses unified CLI backend for consistency")
+    if os.getenv('CIQ_MCP_WARMUP') == '1':
+        # Background thread so the server starts accepting requests immediately
+        threading.Thread(target=warm_cli_cache, daemon=True).start()
     mcp.run()
\ No newline at end of file
@@ -57,6 +57,48 @@ def test_cli_wrapper_search():
     
     return results
 
+def test_cli_wrapper_batch():
+    """Test --batch answers several queries in one run, matching single-query runs"""
+    print("🧪 Testing CLI wrapper batch mode...")
+    
+    queries = ["fuzzball", "war", "ciq", "nonexistent"]
+    
+    try:
+        single_counts = []
+        for query in queries:
+            result = subprocess.run(
+                ['python3', 'cli_wrapper.py', query],
+                cwd='./interfaces/mcp-server',
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            single_counts.append(json.loads(result.stdout).get('total_found', 0))
+        
+        result = subprocess.run(
+            ['python3', 'cli_wrapper.py', '--batch', *queries],
+            cwd='./interfaces/mcp-server',
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode != 0:
+            print(f"  ❌ FAIL: Batch run failed: {result.stderr}")
+            return f"❌ FAIL: Batch mode - Exit code: {result.returncode}, Error: {result.stderr[:100]}"
+        
+        batch_counts = [data.get('total_found', 0) for data in json.loads(result.stdout)]
+        if batch_counts == single_counts:
+            print(f"  ✅ PASS: Batch results match single-query runs {batch_counts}")
+            return f"✅ PASS: Batch mode matches single-query runs {batch_counts}"
+        else:
+            print(f"  ❌ FAIL: Batch counts {batch_counts} != single-query counts {single_counts}")
+            return f"❌ FAIL: Batch mode - counts {batch_counts} != {single_counts}"
+            
+    except Exception as e:
+        print(f"  ❌ FAIL: Exception during batch test: {str(e)}")
+        return f"❌ FAIL: Exception during batch test: {str(e)}"
+
 def test_mcp_server_startup():
     """Test MCP server can start without errors"""
     print("🧪 Testing MCP server startup...")
@@ -93,7 +135,11 @@ def run_mcp_tests():
     cli_results = test_cli_wrapper_search()
     results.extend(cli_results)
     
-    # Test 2: MCP Server Startup
+    # Test 2: CLI Wrapper batch mode
+    batch_result = test_cli_wrapper_batch()
+    results.append(batch_result)
+    
+    # Test 3: MCP Server Startup
     startup_result = test_mcp_server_startup()
     results.append(startup_result)
     
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+REMOTE METADATA FETCH TEST: cache, revalidation, retries and circuit breaker
+
+Runs cli_wrapper.fetch_remote_metadata() against a local http.server standing in
+for GitHub, with XDG_CACHE_HOME pointed at a temp dir so the user's real cache
+is never touched.
+"""
+
+import http.server
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+INVENTORY_PATH = Path(__file__).resolve().parent / 'metadata' / 'asset-inventory.json'
+ETAG = '"v1"'
+
+# One fetch per CLI process, like the real callers; the backoff is zeroed so retries don't sleep
+FETCH_SNIPPET = """
+import json, sys
+import cli_wrapper
+cli_wrapper.METADATA_URL = sys.argv[1]
+cli_wrapper.FETCH_BACKOFF = 0
+print(json.dumps(cli_wrapper.fetch_remote_metadata() is not None))
+"""
+
+class MetadataHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the inventory with an ETag. /flaky fails every other request, /down always fails"""
+    body = INVENTORY_PATH.read_bytes()
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        MetadataHandler.requests.append((self.path, self.headers.get('If-None-Match')))
+        flaky_calls = sum(1 for path, _ in MetadataHandler.requests if path == '/flaky')
+        if self.path == '/down' or (self.path == '/flaky' and flaky_calls % 2 == 1):
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+def start_server():
+    """Start the stand-in metadata server on a free local port"""
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), MetadataHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+def fetch(cache_home, url):
+    """Run one fetch in a fresh CLI process; returns whether metadata came back"""
+    result = subprocess.run(
+        ['python3', '-c', FETCH_SNIPPET, url],
+        cwd='./interfaces/mcp-server',
+        env={**os.environ, 'XDG_CACHE_HOME': cache_home},
+        capture_output=True,
+        text=True,
+        timeout=15
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Exit code: {result.returncode}, Error: {result.stderr[:100]}")
+    return json.loads(result.stdout)
+
+def cache_file(cache_home, name):
+    return Path(cache_home) / 'brand-assets' / name
+
+def expire_cache(cache_home):
+    """Push the cached inventory past its freshness window"""
+    os.utime(cache_file(cache_home, 'inventory.json'), (0, 0))
+
+def check(results, ok, name, details=""):
+    status = "✅ PASS" if ok else "❌ FAIL"
+    results.append(f"{status} {name:22} | {details}")
+    print(f"  {status} {name}: {details}")
+
+def requests_since(start):
+    return MetadataHandler.requests[start:]
+
+def test_fresh_cache_and_revalidation():
+    """A fresh cache skips the network; an expired one is revalidated with If-None-Match"""
+    print("🧪 Testing fresh cache and 304 revalidation...")
+    results = []
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_home:
+            url = f'{base_url}/inventory.json'
+            start = len(MetadataHandler.requests)
+            ok = fetch(cache_home, url) and cache_file(cache_home, 'inventory.json').exists()
+            check(results, ok and len(requests_since(start)) == 1, "first fetch", "cached after one request")
+
+            start = len(MetadataHandler.requests)
+            ok = fetch(cache_home, url)
+            check(results, ok and not requests_since(start), "fresh cache", "served without a request")
+
+            expire_cache(cache_home)
+            start = len(MetadataHandler.requests)
+            ok = fetch(cache_home, url)
+            sent = requests_since(start)
+            refreshed = time.time() - cache_file(cache_home, 'inventory.json').stat().st_mtime < 60
+            check(results, ok and sent == [('/inventory.json', ETAG)] and refreshed,
+                  "304 revalidation", f"requests: {sent}")
+    except Exception as e:
+        check(results, False, "fresh/304", f"Exception: {str(e)}")
+    finally:
+        server.shutdown()
+    return results
+
+def test_retry_on_503():
+    """A transient 503 is retried within the same fetch"""
+    print("🧪 Testing retry on 503...")
+    results = []
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_home:
+            start = len(MetadataHandler.requests)
+            ok = fetch(cache_home, f'{base_url}/flaky')
+            attempts = len(requests_since(start))
+            closed = not cache_file(cache_home, 'breaker.json').exists()
+            check(results, ok and attempts == 2 and closed, "retry on 503", f"{attempts} attempts")
+    except Exception as e:
+        check(results, False, "retry on 503", f"Exception: {str(e)}")
+    finally:
+        server.shutdown()
+    return results
+
+def test_circuit_breaker():
+    """Repeated failures open the breaker; after the reset window one trial fetch closes or reopens it"""
+    print("🧪 Testing circuit breaker open/half-open/close...")
+    results = []
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_home:
+            fetch(cache_home, f'{base_url}/inventory.json')
+            expire_cache(cache_home)
+            breaker_path = cache_file(cache_home, 'breaker.json')
+
+            served = [fetch(cache_home, f'{base_url}/down') for _ in range(3)]
+            state = json.loads(breaker_path.read_text())
+            check(results, all(served) and state['failures'] == 3 and state['opened_at'] > 0,
+                  "breaker opens", f"state: {state}, stale cache served: {all(served)}")
+
+            start = len(MetadataHandler.requests)
+            ok = fetch(cache_home, f'{base_url}/down')
+            check(results, ok and not requests_since(start), "open breaker", "no request, stale cache served")
+
+            # Pretend the reset window has passed
+            breaker_path.write_text(json.dumps({'failures': state['failures'], 'opened_at': 1.0}))
+            fetch(cache_home, f'{base_url}/down')
+            state = json.loads(breaker_path.read_text())
+            check(results, time.time() - state['opened_at'] < 60, "half-open failure", "breaker reopened")
+
+            breaker_path.write_text(json.dumps({'failures': state['failures'], 'opened_at': 1.0}))
+            ok = fetch(cache_home, f'{base_url}/inventory.json')
+            check(results, ok and not breaker_path.exists(), "half-open success", "breaker closed")
+    except Exception as e:
+        check(results, False, "circuit breaker", f"Exception: {str(e)}")
+    finally:
+        server.shutdown()
+    return results
+
+def test_corrupt_cache_meta():
+    """An unreadable meta file falls back to an unconditional GET and is rewritten"""
+    print("🧪 Testing corrupt cache meta file...")
+    results = []
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as cache_home:
+            url = f'{base_url}/inventory.json'
+            fetch(cache_home, url)
+            expire_cache(cache_home)
+            meta_path = cache_file(cache_home, 'inventory.meta.json')
+            meta_path.write_text('{not json')
+
+            start = len(MetadataHandler.requests)
+            ok = fetch(cache_home, url)
+            sent = requests_since(start)
+            meta = json.loads(meta_path.read_text())
+            check(results, ok and sent == [('/inventory.json', None)] and meta.get('etag') == ETAG,
+                  "corrupt meta", f"requests: {sent}, meta: {meta}")
+    except Exception as e:
+        check(results, False, "corrupt meta", f"Exception: {str(e)}")
+    finally:
+        server.shutdown()
+    return results
+
+def run_fetch_tests():
+    """Run all remote metadata fetch tests"""
+    print("🚀 REMOTE METADATA FETCH TESTING")
+    print("=" * 50)
+
+    results = []
+    results.extend(test_fresh_cache_and_revalidation())
+    results.extend(test_retry_on_503())
+    results.extend(test_circuit_breaker())
+    results.extend(test_corrupt_cache_meta())
+
+    print("\n" + "=" * 50)
+    print("📋 FETCH TEST RESULTS SUMMARY:")
+    for result in results:
+        print(f"  {result}")
+
+    passed = sum(1 for r in results if r.startswith("✅"))
+    failed = sum(1 for r in results if r.startswith("❌"))
+
+    print(f"\n🎯 FETCH TESTS: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = run_fetch_tests()
+    sys.exit(0 if success else 1)
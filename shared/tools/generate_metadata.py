@@ -6,10 +6,22 @@ Creates clean, rule-based metadata for scalable asset management
 
 import os
 import json
+import gzip
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+
+# Faster JSON encoding when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Base GitHub raw URL for assets
 BASE_URL = "https://raw.githubusercontent.com/b-ciq/brand-assets/main"
@@ -19,19 +31,26 @@ def parse_filename(filename: str) -> Dict[str, str]:
     Parse consistent filename: {Product}_{type}_{layout}_{color}_{size}.{ext}
     Returns: {product, type, layout, color, size, ext}
     """
-    name_without_ext = filename.rsplit('.', 1)[0]
-    ext = filename.rsplit('.', 1)[1] if '.' in filename else 'png'
+    name_without_ext, dot, ext = filename.rpartition('.')
+    if not dot:
+        name_without_ext, ext = filename, 'png'
     
-    parts = name_without_ext.split('_')
-    if len(parts) < 5:
+    # Need at least five '_'-separated fields; partition avoids building a list
+    if name_without_ext.count('_') < 4:
         return None
     
+    product, _, rest = name_without_ext.partition('_')
+    type_, _, rest = rest.partition('_')
+    layout, _, rest = rest.partition('_')
+    color, _, rest = rest.partition('_')
+    size = rest.partition('_')[0]
+    
     return {
-        'product': parts[0].lower(),
-        'type': parts[1], 
-        'layout': parts[2],
-        'color': parts[3],
-        'size': parts[4],
+        'product': product.lower(),
+        'type': type_,
+        'layout': layout,
+        'color': color,
+        'size': size,
         'ext': ext
     }
 
@@ -50,12 +69,9 @@ def parse_svg_filename(filename: str) -> Dict[str, str]:
         return None
         
     # Split on _logo_ to separate product from variant
-    parts = name_without_ext.split('_logo_')
-    if len(parts) != 2:
+    product, _, variant_part = name_without_ext.partition('_logo_')
+    if '_logo_' in variant_part:
         return None
-        
-    product = parts[0]
-    variant_part = parts[1]
     
     # Parse variant: h-blk, v-blk, symbol-blk
     if variant_part.endswith('-blk'):
@@ -87,34 +103,43 @@ def parse_document_filename(filename: str) -> Dict[str, str]:
     Parse document filename: {Product}_{Document_Type}.{ext}
     Returns: {product, doc_type, ext}
     """
-    name_without_ext = filename.rsplit('.', 1)[0]
-    ext = filename.rsplit('.', 1)[1] if '.' in filename else 'pdf'
+    name_without_ext, dot, ext = filename.rpartition('.')
+    if not dot:
+        name_without_ext, ext = filename, 'pdf'
     
-    parts = name_without_ext.split('_')
-    if len(parts) < 2:
+    product, sep, rest = name_without_ext.partition('_')
+    if not sep:
         return None
     
-    # Join remaining parts as document type (e.g., "Solution_Brief")
-    doc_type = '_'.join(parts[1:]).lower().replace('_', ' ')
+    # Remaining parts form the document type (e.g., "Solution_Brief")
+    doc_type = rest.lower().replace('_', ' ')
     
     return {
-        'product': parts[0].lower(),
+        'product': product.lower(),
         'doc_type': doc_type,
         'ext': ext
     }
 
 def generate_asset_key(parsed: Dict[str, str]) -> str:
     """Generate consistent asset key"""
-    if parsed['layout'] in ['onecolor', 'twocolor', 'green']:
+    return _asset_key(parsed['layout'], parsed['color'])
+
+# CIQ company logo layouts (special variants keyed by layout + color)
+CIQ_VARIANT_LAYOUTS = frozenset({'onecolor', 'twocolor', 'green'})
+
+@lru_cache(maxsize=64)
+def _asset_key(layout: str, color: str) -> str:
+    if layout in CIQ_VARIANT_LAYOUTS:
         # CIQ special variants
-        return f"{parsed['layout']}_{parsed['color']}"
-    elif parsed['layout'] == 'square':
+        return f"{layout}_{color}"
+    elif layout == 'square':
         # Icons
-        return f"icon_{parsed['color']}"
+        return f"icon_{color}"
     else:
         # Regular logos
-        return f"{parsed['layout']}_{parsed['color']}"
+        return f"{layout}_{color}"
 
+@lru_cache(maxsize=64)
 def determine_background(color: str) -> str:
     """Determine optimal background for color"""
     if color.lower() == 'black':
@@ -124,128 +149,196 @@ def determine_background(color: str) -> str:
     else:
         return 'any'    # color logos work on various backgrounds
 
-def get_asset_tags(layout: str, type_: str) -> List[str]:
-    """Get semantic tags for asset matching"""
-    tags = []
-    
-    if layout == 'square' or type_ == 'icon':
-        tags.extend(['favicon', 'app_icon', 'compact', 'small_space', 'avatar'])
-    elif layout == 'horizontal':
-        tags.extend(['business_card', 'header', 'email_signature', 'letterhead', 'wide_format'])
-    elif layout == 'vertical':
-        tags.extend(['mobile', 'social_profile', 'tall_banner', 'poster', 'stacked'])
-    elif layout in ['onecolor', 'twocolor', 'green']:
-        if layout == 'onecolor':
-            tags.extend(['supporting', 'footer', 'watermark', 'minimal', 'professional'])
-        elif layout == 'twocolor':
-            tags.extend(['hero', 'primary', 'homepage', 'presentation', 'main_branding'])
-        elif layout == 'green':
-            tags.extend(['accent', 'highlight', 'call_to_action', 'brand_pop'])
-    
-    return tags
+# Semantic tags per logo layout (icons share the 'square' entry)
+ASSET_TAGS_BY_LAYOUT = {
+    'square': ('favicon', 'app_icon', 'compact', 'small_space', 'avatar'),
+    'horizontal': ('business_card', 'header', 'email_signature', 'letterhead', 'wide_format'),
+    'vertical': ('mobile', 'social_profile', 'tall_banner', 'poster', 'stacked'),
+    'onecolor': ('supporting', 'footer', 'watermark', 'minimal', 'professional'),
+    'twocolor': ('hero', 'primary', 'homepage', 'presentation', 'main_branding'),
+    'green': ('accent', 'highlight', 'call_to_action', 'brand_pop')
+}
+
+# Semantic tags per document type: (substring triggers, tags) - first match wins
+DOCUMENT_BASE_TAGS = ('document', 'pdf')
+DOCUMENT_TAGS_BY_TYPE = (
+    (('solution brief',), DOCUMENT_BASE_TAGS + ('sales', 'overview', 'features', 'benefits', 'summary')),
+    (('datasheet',), DOCUMENT_BASE_TAGS + ('technical', 'specifications', 'details', 'reference')),
+    (('white paper', 'whitepaper'), DOCUMENT_BASE_TAGS + ('research', 'deep_dive', 'analysis', 'thought_leadership')),
+    (('case study',), DOCUMENT_BASE_TAGS + ('customer', 'success_story', 'implementation', 'results')),
+    (('user guide', 'manual'), DOCUMENT_BASE_TAGS + ('documentation', 'how_to', 'instructions', 'guide'))
+)
+
+def get_asset_tags(layout: str, type_: str) -> Tuple[str, ...]:
+    """Get semantic tags for asset matching (shared immutable tuple)"""
+    if type_ == 'icon':
+        layout = 'square'
+    return ASSET_TAGS_BY_LAYOUT.get(layout, ())
+
+def get_document_tags(doc_type: str) -> Tuple[str, ...]:
+    """Get semantic tags for document matching (shared immutable tuple)"""
+    for triggers, tags in DOCUMENT_TAGS_BY_TYPE:
+        if any(trigger in doc_type for trigger in triggers):
+            return tags
+    return DOCUMENT_BASE_TAGS
+
+@dataclass
+class IndexAccumulator:
+    """Index values collected while assets are scanned, so no second pass is needed"""
+    layouts: set = field(default_factory=set)
+    colors: set = field(default_factory=set)
+    backgrounds: set = field(default_factory=set)
+    doc_types: set = field(default_factory=set)
+    tags: set = field(default_factory=set)
+    total_assets: int = 0
+    
+    def add_product(self, product_assets: Dict[str, Any]) -> None:
+        """Fold one product's assets into the index"""
+        assets = product_assets.values()
+        # One C-level set.update over every tag list of the product
+        self.tags.update(chain.from_iterable(asset['tags'] for asset in assets))
+        
+        for asset in assets:
+            # Handle logos
+            if asset['type'] != 'document':
+                self.layouts.add(asset['layout'])
+                self.colors.add(asset['color'])
+                self.backgrounds.add(asset['background'])
+            else:
+                # Handle documents
+                self.doc_types.add(asset['doc_type'])
+        self.total_assets += len(product_assets)
+    
+    def to_index(self, products: List[str]) -> Dict[str, Any]:
+        return {
+            "products": sorted(products),
+            "layouts": sorted(self.layouts),
+            "colors": sorted(self.colors),
+            "backgrounds": sorted(self.backgrounds),
+            "doc_types": sorted(self.doc_types),
+            "tags": sorted(self.tags),
+            "total_assets": self.total_assets
+        }
+
+def list_files(directory: Path, extensions: tuple) -> List[str]:
+    """Sorted names of visible files in a directory with one of the given extensions (single scandir pass)"""
+    if not directory.is_dir():
+        return []
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(extensions) and not entry.name.startswith('.') and entry.is_file()
+        )
 
-def get_document_tags(doc_type: str) -> List[str]:
-    """Get semantic tags for document matching"""
-    tags = ['document', 'pdf']
-    
-    if 'solution brief' in doc_type:
-        tags.extend(['sales', 'overview', 'features', 'benefits', 'summary'])
-    elif 'datasheet' in doc_type:
-        tags.extend(['technical', 'specifications', 'details', 'reference'])
-    elif 'white paper' in doc_type or 'whitepaper' in doc_type:
-        tags.extend(['research', 'deep_dive', 'analysis', 'thought_leadership'])
-    elif 'case study' in doc_type:
-        tags.extend(['customer', 'success_story', 'implementation', 'results'])
-    elif 'user guide' in doc_type or 'manual' in doc_type:
-        tags.extend(['documentation', 'how_to', 'instructions', 'guide'])
-    
-    return tags
+def list_subdirectories(directory: Path) -> List[str]:
+    """Sorted names of visible subdirectories"""
+    if not directory.is_dir():
+        return []
+    with os.scandir(directory) as entries:
+        return sorted(entry.name for entry in entries if not entry.name.startswith('.') and entry.is_dir())
 
-def scan_assets_directory(assets_path: Path) -> Dict[str, Any]:
-    """Scan and catalog all assets"""
+def scan_product_directory(product_dir: Path) -> Tuple[str, Dict[str, Any]]:
+    """Scan one product's logos and documents. Returns (product_name, product_assets)"""
+    product_name = product_dir.name
+    product_assets = {}
+    
+    # One listing of the logos directory serves both naming schemes
+    logo_files = list_files(product_dir / "logos", ('.png', '.svg'))
+    
+    # Scan logos (PNG files with old naming)
+    for filename in logo_files:
+        if not filename.endswith('.png'):
+            continue
+        parsed = parse_filename(filename)
+        if parsed:
+            key = generate_asset_key(parsed)
+            product_assets[key] = {
+                "url": f"{BASE_URL}/assets/products/{product_name}/logos/{filename}",
+                "filename": filename,
+                "background": determine_background(parsed['color']),
+                "color": parsed['color'],
+                "layout": "icon" if parsed['layout'] == 'square' else parsed['layout'],
+                "type": parsed['type'],
+                "size": parsed['size'],
+                "tags": get_asset_tags(parsed['layout'], parsed['type'])
+            }
+    
+    # Scan SVG files with new naming pattern
+    for filename in logo_files:
+        parsed = parse_svg_filename(filename)
+        if parsed:
+            key = generate_asset_key(parsed)
+            product_assets[key] = {
+                "url": f"http://localhost:3000/assets/products/{product_name}/logos/{filename}",
+                "filename": filename,
+                "background": determine_background(parsed['color']),
+                "color": parsed['color'],
+                "layout": parsed['layout'],
+                "type": parsed['type'],
+                "size": parsed['size'],
+                "tags": get_asset_tags(parsed['layout'], parsed['type'])
+            }
+    
+    # Scan documents
+    for filename in list_files(product_dir / "documents", ('.pdf',)):
+        parsed = parse_document_filename(filename)
+        if parsed:
+            key = f"doc_{parsed['doc_type'].replace(' ', '_')}"
+            product_assets[key] = {
+                "url": f"{BASE_URL}/assets/products/{product_name}/documents/{filename}",
+                "filename": filename,
+                "type": "document",
+                "doc_type": parsed['doc_type'],
+                "ext": parsed['ext'],
+                "tags": get_document_tags(parsed['doc_type'])
+            }
+    
+    return product_name, product_assets
+
+def scan_assets_directory(assets_path: Path, workers: Optional[int] = 1, index: Optional[IndexAccumulator] = None) -> Dict[str, Any]:
+    """
+    Scan and catalog all assets. Products are scanned in-process unless workers asks for
+    a process pool (None = one process per CPU).
+    If an IndexAccumulator is passed it is filled as each product is collected.
+    """
     assets = {}
     
     # Scan global assets (CIQ)
-    global_logos = assets_path / "global" / "logos"
-    if global_logos.exists():
-        ciq_assets = {}
-        for file_path in global_logos.glob("*.png"):
-            parsed = parse_filename(file_path.name)
-            if parsed:
-                key = generate_asset_key(parsed)
-                ciq_assets[key] = {
-                    "url": f"{BASE_URL}/assets/global/logos/{file_path.name}",
-                    "filename": file_path.name,
-                    "background": determine_background(parsed['color']),
-                    "color": parsed['color'],
-                    "layout": parsed['layout'],
-                    "type": parsed['type'],
-                    "size": parsed['size'],
-                    "tags": get_asset_tags(parsed['layout'], parsed['type'])
-                }
-        if ciq_assets:
-            assets['ciq'] = ciq_assets
-    
-    # Scan product assets
+    ciq_assets = {}
+    for filename in list_files(assets_path / "global" / "logos", ('.png',)):
+        parsed = parse_filename(filename)
+        if parsed:
+            key = generate_asset_key(parsed)
+            ciq_assets[key] = {
+                "url": f"{BASE_URL}/assets/global/logos/{filename}",
+                "filename": filename,
+                "background": determine_background(parsed['color']),
+                "color": parsed['color'],
+                "layout": parsed['layout'],
+                "type": parsed['type'],
+                "size": parsed['size'],
+                "tags": get_asset_tags(parsed['layout'], parsed['type'])
+            }
+    if ciq_assets:
+        assets['ciq'] = ciq_assets
+        if index is not None:
+            index.add_product(ciq_assets)
+    
+    # Scan product assets - each directory is independent, but a handful of small dirs scans
+    # faster in-process than it takes to start a pool, so only fan out when asked to
     products_path = assets_path / "products"
-    if products_path.exists():
-        for product_dir in products_path.iterdir():
-            if product_dir.is_dir():
-                product_name = product_dir.name
-                product_assets = {}
-                
-                # Scan logos (PNG files with old naming)
-                logos_path = product_dir / "logos"
-                if logos_path.exists():
-                    for file_path in logos_path.glob("*.png"):
-                        parsed = parse_filename(file_path.name)
-                        if parsed:
-                            key = generate_asset_key(parsed)
-                            product_assets[key] = {
-                                "url": f"{BASE_URL}/assets/products/{product_name}/logos/{file_path.name}",
-                                "filename": file_path.name,
-                                "background": determine_background(parsed['color']),
-                                "color": parsed['color'],
-                                "layout": "icon" if parsed['layout'] == 'square' else parsed['layout'],
-                                "type": parsed['type'],
-                                "size": parsed['size'],
-                                "tags": get_asset_tags(parsed['layout'], parsed['type'])
-                            }
-                    
-                    # Scan SVG files with new naming pattern
-                    for file_path in logos_path.glob("*.svg"):
-                        parsed = parse_svg_filename(file_path.name)
-                        if parsed:
-                            key = generate_asset_key(parsed)
-                            product_assets[key] = {
-                                "url": f"http://localhost:3000/assets/products/{product_name}/logos/{file_path.name}",
-                                "filename": file_path.name,
-                                "background": determine_background(parsed['color']),
-                                "color": parsed['color'],
-                                "layout": parsed['layout'],
-                                "type": parsed['type'],
-                                "size": parsed['size'],
-                                "tags": get_asset_tags(parsed['layout'], parsed['type'])
-                            }
-                
-                # Scan documents
-                documents_path = product_dir / "documents"
-                if documents_path.exists():
-                    for file_path in documents_path.glob("*.pdf"):
-                        parsed = parse_document_filename(file_path.name)
-                        if parsed:
-                            key = f"doc_{parsed['doc_type'].replace(' ', '_')}"
-                            product_assets[key] = {
-                                "url": f"{BASE_URL}/assets/products/{product_name}/documents/{file_path.name}",
-                                "filename": file_path.name,
-                                "type": "document",
-                                "doc_type": parsed['doc_type'],
-                                "ext": parsed['ext'],
-                                "tags": get_document_tags(parsed['doc_type'])
-                            }
-                
-                if product_assets:
-                    assets[product_name] = product_assets
+    product_dirs = [products_path / name for name in list_subdirectories(products_path)]
+    if workers == 1 or len(product_dirs) < 2:
+        scanned = map(scan_product_directory, product_dirs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scanned = list(executor.map(scan_product_directory, product_dirs))
+    
+    for product_name, product_assets in scanned:
+        if product_assets:
+            assets[product_name] = product_assets
+            if index is not None:
+                index.add_product(product_assets)
     
     return assets
 
@@ -337,38 +430,22 @@ def generate_rules() -> Dict[str, Any]:
         }
     }
 
-def generate_index(assets: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate index for fast lookups"""
-    products = list(assets.keys())
-    
-    all_layouts = set()
-    all_colors = set()
-    all_backgrounds = set() 
-    all_tags = set()
-    all_doc_types = set()
-    
-    for product_assets in assets.values():
-        for asset in product_assets.values():
-            # Handle logos
-            if asset['type'] != 'document':
-                all_layouts.add(asset['layout'])
-                all_colors.add(asset['color'])
-                all_backgrounds.add(asset['background'])
-            else:
-                # Handle documents
-                all_doc_types.add(asset['doc_type'])
-            
-            all_tags.update(asset['tags'])
-    
-    return {
-        "products": sorted(products),
-        "layouts": sorted(all_layouts),
-        "colors": sorted(all_colors),
-        "backgrounds": sorted(all_backgrounds),
-        "doc_types": sorted(all_doc_types),
-        "tags": sorted(all_tags),
-        "total_assets": sum(len(assets_dict) for assets_dict in assets.values())
-    }
+def generate_index(assets: Dict[str, Any], accumulator: IndexAccumulator = None) -> Dict[str, Any]:
+    """Generate index for fast lookups, reusing an accumulator filled during the scan if given"""
+    if accumulator is None:
+        accumulator = IndexAccumulator()
+        for product_assets in assets.values():
+            accumulator.add_product(product_assets)
+    
+    return accumulator.to_index(list(assets.keys()))
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize metadata to JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
 
 def load_color_palette_info(assets_path: Path) -> Dict[str, Any]:
     """Load color palette information if available"""
@@ -393,6 +470,9 @@ def main():
     parser = argparse.ArgumentParser(description='Generate declarative asset metadata')
     parser.add_argument('--base-path', default='.', help='Base path to scan (default: current directory)')
     parser.add_argument('--output', default='metadata/asset-inventory.json', help='Output JSON file')
+    parser.add_argument('--compact', action='store_true', help='Write minified JSON (smaller file, faster to load)')
+    parser.add_argument('--gzip', action='store_true', help='Also write a gzipped minified copy next to the output (<output>.gz)')
+    parser.add_argument('--workers', type=int, default=1, help='Processes used to scan products (default: 1, scan in-process)')
     
     args = parser.parse_args()
     assets_path = Path(args.base_path) / "assets"
@@ -400,7 +480,8 @@ def main():
     print(f"🔍 Scanning assets for declarative metadata generation...")
     
     # Scan all assets
-    assets = scan_assets_directory(assets_path)
+    index = IndexAccumulator()
+    assets = scan_assets_directory(assets_path, workers=args.workers, index=index)
     
     # Load color palette info
     color_info = load_color_palette_info(assets_path)
@@ -409,7 +490,7 @@ def main():
     metadata = {
         "assets": assets,
         "rules": generate_rules(),
-        "index": generate_index(assets),
+        "index": generate_index(assets, index),
         "colors": color_info
     }
     
@@ -418,14 +499,20 @@ def main():
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Write metadata
-    with open(output_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    output_path.write_bytes(dumps_json(metadata, indent=not args.compact))
+    
+    # Pre-compressed copy for publishing - minified, since indentation only adds bytes
+    if args.gzip:
+        gzip_path = output_path.with_name(output_path.name + '.gz')
+        gzip_path.write_bytes(gzip.compress(dumps_json(metadata, indent=False), compresslevel=6))
     
     # Print summary
     total_assets = metadata["index"]["total_assets"]
     products = len(metadata["index"]["products"])
     
     print(f"\n✅ Generated declarative metadata: {args.output}")
+    if args.gzip:
+        print(f"   🗜️  Compressed copy: {gzip_path} ({gzip_path.stat().st_size} bytes)")
     print(f"   📊 {total_assets} assets across {products} products")
     print(f"   🏷️  {len(metadata['index']['tags'])} semantic tags")
     print(f"   📐 {len(metadata['index']['layouts'])} layouts")
@@ -11,15 +11,21 @@ import subprocess
 import json
 import sys
 import http.client
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 class UnifiedSearchTester:
     def __init__(self):
+        # (status, query, details) records, rendered once in run_tests
         self.results = []
         
     def log(self, message):
         print(f"  {message}")
         
+    def record(self, status, query, details):
+        self.results.append((status, query, details))
+        
     def test_cli_backend(self, query):
         """Test the CLI backend directly"""
         try:
@@ -104,7 +110,7 @@ class UnifiedSearchTester:
                 
         details_str = " | ".join(details) if details else "Results consistent"
         
-        return f"{status} {query:12} | {details_str}"
+        return status, query, details_str
         
     def test_search_consistency(self):
         """Test consistency across interfaces"""
@@ -130,25 +136,27 @@ class UnifiedSearchTester:
         except:
             self.log("⚠️ Web server not running - testing CLI only")
             
-        for query, description in test_queries:
+        def run_query(query):
             self.log(f"Testing '{query}'...")
-            
-            # Test CLI backend
+            # Test CLI backend (and web API when it's up)
             cli_result = self.test_cli_backend(query)
+            web_result = self.test_web_api(query) if web_available else None
+            return cli_result, web_result
+            
+        # Queries are independent - run their CLI processes concurrently
+        with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+            outcomes = list(executor.map(run_query, [query for query, _ in test_queries]))
             
+        for (query, description), (cli_result, web_result) in zip(test_queries, outcomes):
             if web_available:
-                # Test web API
-                web_result = self.test_web_api(query)
-                
                 # Compare results
-                comparison = self.compare_results(query, cli_result, web_result)
-                self.results.append(comparison)
+                self.record(*self.compare_results(query, cli_result, web_result))
             else:
                 # CLI only
                 if cli_result['success']:
-                    self.results.append(f"✅ PASS {query:12} | CLI found {cli_result['total']} assets")
+                    self.record("✅ PASS", query, f"CLI found {cli_result['total']} assets")
                 else:
-                    self.results.append(f"❌ FAIL {query:12} | CLI failed: {cli_result['error']}")
+                    self.record("❌ FAIL", query, f"CLI failed: {cli_result['error']}")
     
     def test_pattern_matching(self):
         """Test specific pattern matching scenarios"""
@@ -161,9 +169,10 @@ class UnifiedSearchTester:
             ("roc", "rlc-hardened", "Roc pattern should match rlc-hardened")
         ]
         
-        for pattern, expected, description in pattern_tests:
-            cli_result = self.test_cli_backend(pattern)
-            
+        with ThreadPoolExecutor(max_workers=len(pattern_tests)) as executor:
+            cli_results = list(executor.map(self.test_cli_backend, [pattern for pattern, _, _ in pattern_tests]))
+        
+        for (pattern, expected, description), cli_result in zip(pattern_tests, cli_results):
             if cli_result['success'] and cli_result['total'] > 0:
                 # Check if any asset matches expected product
                 found_expected = any(
@@ -173,11 +182,11 @@ class UnifiedSearchTester:
                 )
                 
                 if found_expected:
-                    self.results.append(f"✅ PASS {pattern:12} | Pattern matching works: {pattern} -> {expected}")
+                    self.record("✅ PASS", pattern, f"Pattern matching works: {pattern} -> {expected}")
                 else:
-                    self.results.append(f"⚠️ WARN {pattern:12} | Found assets but not expected {expected}")
+                    self.record("⚠️ WARN", pattern, f"Found assets but not expected {expected}")
             else:
-                self.results.append(f"❌ FAIL {pattern:12} | Pattern matching failed: {description}")
+                self.record("❌ FAIL", pattern, f"Pattern matching failed: {description}")
     
     def run_tests(self):
         """Run all consistency tests"""
@@ -190,12 +199,13 @@ class UnifiedSearchTester:
         # Results summary
         print("\n" + "=" * 60)
         print("📋 SEARCH CONSISTENCY TEST RESULTS:")
-        for result in self.results:
-            print(f"  {result}")
+        for status, query, details in self.results:
+            print(f"  {status} {query:12} | {details}")
             
-        passed = sum(1 for r in self.results if r.startswith("✅"))
-        failed = sum(1 for r in self.results if r.startswith("❌"))
-        warned = sum(1 for r in self.results if r.startswith("⚠️"))
+        counts = Counter(status for status, _, _ in self.results)
+        passed = counts["✅ PASS"]
+        failed = counts["❌ FAIL"]
+        warned = counts["⚠️ WARN"]
         
         print(f"\n🎯 CONSISTENCY TESTS: {passed} passed, {failed} failed, {warned} warnings")
         